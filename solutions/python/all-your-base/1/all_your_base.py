@@ -1,5 +1,8 @@
 MIN_BASE = 2
 
+# Digit lists up to this length are converted digit by digit; longer ones are split
+_NAIVE_DIGITS = 64
+
 
 def rebase(input_base: int, digits: list[int], output_base: int) -> list[int]:
     """Convert a number from one base to another.
@@ -20,19 +23,107 @@ def rebase(input_base: int, digits: list[int], output_base: int) -> list[int]:
     if output_base < MIN_BASE:
         raise ValueError("output base must be >= 2")
 
-    num = 0
-    for d in digits:
-        if not (0 <= d < input_base):
-            raise ValueError("all digits must satisfy 0 <= d < input base")
-        num = num * input_base + d
+    if digits and (min(digits) < 0 or max(digits) >= input_base):
+        raise ValueError("all digits must satisfy 0 <= d < input base")
+
+    # Both bases are powers of two: regroup the bits, no big ints needed
+    if _is_power_of_two(input_base) and _is_power_of_two(output_base):
+        return _regroup_bits(
+            digits, input_base.bit_length() - 1, output_base.bit_length() - 1
+        )
 
+    num = _digits_to_int(digits, input_base, {})
     if num == 0:
         return [0]
 
     result: list[int] = []
-    while num:
-        num, rem = divmod(num, output_base)
-        result.append(rem)
+    _int_to_digits(num, output_base, result)
+    return result
+
+
+def _is_power_of_two(n: int) -> bool:
+    return n & (n - 1) == 0
+
+
+def _regroup_bits(digits: list[int], in_bits: int, out_bits: int) -> list[int]:
+    """Convert between bases 2^in_bits and 2^out_bits by regrouping the bits of the digits."""
+    mask = (1 << out_bits) - 1
+    result: list[int] = []
+
+    # Feed the input digits into a small bit buffer, least significant first,
+    # and take output digits from it whenever it holds enough bits
+    buffer = 0
+    buffered_bits = 0
+    for d in reversed(digits):
+        buffer |= d << buffered_bits
+        buffered_bits += in_bits
+        while buffered_bits >= out_bits:
+            result.append(buffer & mask)
+            buffer >>= out_bits
+            buffered_bits -= out_bits
+    if buffer:
+        result.append(buffer)
+
+    # Drop leading zeros (collected last, since the digits are in reverse order)
+    while result and result[-1] == 0:
+        result.pop()
+    if not result:
+        return [0]
 
-    # Digits are collected in reverse order (least significant first), so reverse before returning.
     return result[::-1]
+
+
+def _digits_to_int(digits: list[int], base: int, powers: dict[int, int]) -> int:
+    """Convert a list of digits to an int by splitting it in halves.
+
+    The high half is shifted by base^(length of the low half); these powers are
+    cached in `powers`, since the halves at each level mostly have the same length.
+    Combining halves of similar size lets Python use its fast big-int multiplication.
+    """
+    if len(digits) <= _NAIVE_DIGITS:
+        num = 0
+        for d in digits:
+            num = num * base + d
+        return num
+
+    mid = len(digits) // 2
+    low_len = len(digits) - mid
+    if low_len not in powers:
+        powers[low_len] = base**low_len
+    high = _digits_to_int(digits[:mid], base, powers)
+    low = _digits_to_int(digits[mid:], base, powers)
+    return high * powers[low_len] + low
+
+
+def _int_to_digits(num: int, base: int, result: list[int]) -> None:
+    """Append the digits of num > 0 in the given base to result, most significant first.
+
+    Uses a power tree: powers[i] = base^(2^i). Dividing by the largest power that
+    fits splits the number into halves of similar size, which are converted
+    recursively; the low half is padded with zeros to its full length.
+    """
+    powers = [base]
+    while powers[-1] * powers[-1] <= num:
+        powers.append(powers[-1] * powers[-1])
+
+    def convert(n: int, level: int, padded: bool) -> None:
+        # n < base^(2^(level + 1)), i.e. it has at most 2^(level + 1) digits
+        width = 2 << level
+        if width <= _NAIVE_DIGITS:
+            chunk: list[int] = []
+            while n:
+                n, rem = divmod(n, base)
+                chunk.append(rem)
+            if padded:
+                chunk.extend([0] * (width - len(chunk)))
+            result.extend(reversed(chunk))
+            return
+
+        high, low = divmod(n, powers[level])
+        if padded or high:
+            convert(high, level - 1, padded)
+            convert(low, level - 1, True)
+        else:
+            convert(low, level - 1, False)
+
+    convert(num, len(powers) - 1, False)
@@ -1,3 +1,12 @@
+import os
+import pickle
+from collections.abc import Iterable
+
+# From this many candidates on, bucketing by length and comparing letter counts
+# beats sorting each candidate
+COUNT_MIN_CANDIDATES = 32
+
+
 def find_anagrams(word: str, candidates: list[str]) -> list[str]:
     """
     Finds all anagrams of a given target word from a list of candidate words.
@@ -17,6 +26,41 @@ def find_anagrams(word: str, candidates: list[str]) -> list[str]:
         ['tones', 'notes', 'Seton']
     """
     word = word.lower()
+
+    if len(candidates) < COUNT_MIN_CANDIDATES or "\u0307" in word:
+        return _find_anagrams_by_sorting(word, candidates)
+
+    # Bucket the candidates by length once, before lowercasing them. Lowercasing
+    # keeps the length of every character except "İ" (U+0130), which becomes "i"
+    # plus a combining dot (U+0307); the word has no such dot, so its anagrams
+    # cannot contain "İ" and have the same length before lowercasing
+    length = len(word)
+    same_length = [candidate for candidate in candidates if len(candidate) == length]
+
+    # Count each distinct letter of the word once; a candidate of the same length
+    # with the same counts for these letters cannot contain any other letter
+    letter_counts = [(letter, word.count(letter)) for letter in set(word)]
+
+    anagrams: list[str] = []
+    for candidate in same_length:
+        candidate_lower = candidate.lower()
+
+        # Check that word is not itself (and that no "İ" made it longer)
+        if candidate_lower == word or len(candidate_lower) != length:
+            continue
+
+        # Compare letter counts instead of sorting, stopping at the first mismatch
+        for letter, count in letter_counts:
+            if candidate_lower.count(letter) != count:
+                break
+        else:
+            anagrams.append(candidate)
+
+    return anagrams
+
+
+def _find_anagrams_by_sorting(word: str, candidates: list[str]) -> list[str]:
+    """Find the anagrams of the lowercase word by comparing sorted letters."""
     sorted_word = sorted(word)
 
     anagrams: list[str] = []
@@ -35,3 +79,65 @@ def find_anagrams(word: str, candidates: list[str]) -> list[str]:
             anagrams.append(candidate)
 
     return anagrams
+
+
+class AnagramIndex:
+    """
+    An index for answering many anagram queries against a fixed list of candidates.
+
+    Candidates are grouped by their signature (their lowercase letters in sorted order),
+    which is the same for all anagrams of a word. A query computes the signature of the
+    word once and returns the group, so its cost does not depend on the number of candidates.
+
+    Examples:
+        >>> index = AnagramIndex(["stone", "tones", "banana", "tons", "notes", "Seton"])
+        >>> index.find("stone")
+        ['tones', 'notes', 'Seton']
+    """
+
+    def __init__(self, candidates: Iterable[str]):
+        """
+        Build the index.
+
+        Parameters:
+            candidates (Iterable[str]): The candidate words to answer queries against.
+        """
+        self._groups: dict[str, list[str]] = {}
+        for candidate in candidates:
+            self._groups.setdefault(_signature(candidate), []).append(candidate)
+
+    def find(self, word: str) -> list[str]:
+        """
+        Find all candidates that are anagrams of word, like find_anagrams.
+
+        The comparison is case-insensitive, and a word is not considered an anagram of itself.
+        Matches are returned in the order of the candidates.
+        """
+        word_lower = word.lower()
+        return [
+            candidate
+            for candidate in self._groups.get(_signature(word_lower), [])
+            if candidate.lower() != word_lower
+        ]
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the index to a file."""
+        with open(path, "wb") as f:
+            pickle.dump(self._groups, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "AnagramIndex":
+        """
+        Load an index written with save, without recomputing any signatures.
+
+        Only load files from trusted sources (they are unpickled).
+        """
+        index = cls(())
+        with open(path, "rb") as f:
+            index._groups = pickle.load(f)
+        return index
+
+
+def _signature(word: str) -> str:
+    """The letters of word in lowercase and sorted order, shared by all of its anagrams."""
+    return "".join(sorted(word.lower()))
@@ -1,5 +1,25 @@
-# Cache to store previously computed Collatz steps for optimization
-__collatz_cache: dict[int, int] = {1: 0}  # 1 requires 0 steps
+from array import array
+from collections import OrderedDict
+from typing import NamedTuple
+
+# Default bound below which steps_range keeps step counts in a dense array
+DENSE_CACHE_BOUND = 1 << 22
+
+# Default number of step counts steps_range keeps for values above the dense bound
+EXCURSION_CACHE_SIZE = 1 << 16
+
+# Maximum number of step counts cached by steps()
+STEPS_CACHE_SIZE = 1 << 20
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the steps() cache, like functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
 
 
 def steps(number: int) -> int:
@@ -23,21 +43,178 @@ def steps(number: int) -> int:
     if number < 1:
         raise ValueError("Only positive integers are allowed")
 
-    original_number = number
-    steps: int = 0
+    # Every value on the trajectory is cached, not just the starting number
+    return _steps_cached(number, _NO_DENSE_CACHE, _steps_cache)
+
+
+def cache_info() -> CacheInfo:
+    """Return the hit, miss and eviction counters and the size of the steps() cache."""
+    return _steps_cache.info()
+
+
+def cache_clear() -> None:
+    """Clear the steps() cache and its statistics."""
+    _steps_cache.clear()
+
+
+def steps_range(
+    lo: int,
+    hi: int,
+    dense_bound: int = DENSE_CACHE_BOUND,
+    excursion_cache_size: int = EXCURSION_CACHE_SIZE,
+) -> array:
+    """
+    Calculate the number of Collatz steps for every starting number in [lo, hi).
+
+    Every value visited on a trajectory gets its step count cached, so later
+    trajectories stop as soon as they reach a known value. Values below
+    `dense_bound` are cached in a compact array; larger values (the excursions
+    of trajectories above the bound) in a bounded segmented LRU cache.
+
+    Parameters:
+        lo (int): The first starting number (must be positive).
+        hi (int): The end of the range (exclusive).
+        dense_bound (int): Values below this bound are cached in the dense array.
+        excursion_cache_size (int): Maximum number of larger values to cache.
+
+    Returns:
+        array: The number of steps for lo, lo + 1, ..., hi - 1.
+
+    Raises:
+        ValueError: If lo is not a positive integer.
+    """
+    if lo < 1:
+        raise ValueError("Only positive integers are allowed")
+
+    # 0 marks unknown entries (only 1 really needs 0 steps, and it is never cached)
+    dense = array("H", [0]) * dense_bound
+    excursions = _SegmentedLRUCache(excursion_cache_size)
+
+    return array("I", (_steps_cached(n, dense, excursions) for n in range(lo, hi)))
+
+
+def max_steps(lo: int, hi: int) -> tuple[int, int]:
+    """
+    Find the starting number in [lo, hi) that takes the most Collatz steps.
+
+    Parameters:
+        lo (int): The first starting number (must be positive).
+        hi (int): The end of the range (exclusive, must be greater than lo).
+
+    Returns:
+        tuple[int, int]: The (smallest) record holder and its number of steps.
+
+    Raises:
+        ValueError: If lo is not a positive integer or the range is empty.
+    """
+    if hi <= lo:
+        raise ValueError("The range must not be empty")
+
+    counts = steps_range(lo, hi)
+    record = max(range(len(counts)), key=counts.__getitem__)
+    return lo + record, counts[record]
+
+
+class _SegmentedLRUCache:
+    """
+    A bounded mapping with segmented LRU eviction.
+
+    New entries go into a probationary segment; entries that are hit again are
+    promoted to a protected segment (80% of the capacity). Values that many
+    trajectories pass through thus survive bursts of one-off values, which are
+    evicted first from the probationary segment.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.protected_size = maxsize * 4 // 5
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self._probation: OrderedDict[int, int] = OrderedDict()
+        self._protected: OrderedDict[int, int] = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of this cache."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self))
+
+    def get(self, key: int) -> int | None:
+        """Return the cached value for key (marking it as recently used), or None."""
+        value = self._protected.get(key)
+        if value is not None:
+            self._protected.move_to_end(key)
+            self.hits += 1
+            return value
+
+        value = self._probation.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+
+        # Second hit: promote to the protected segment, demoting its oldest entry
+        self.hits += 1
+        self._protected[key] = value
+        if len(self._protected) > self.protected_size:
+            demoted, demoted_value = self._protected.popitem(last=False)
+            self._probation[demoted] = demoted_value
+        return value
+
+    def put(self, key: int, value: int) -> None:
+        """Cache a value, evicting the least recently used probationary entry if full."""
+        if self.maxsize <= 0:
+            return
+        if key in self._protected:
+            self._protected[key] = value
+            return
+        self._probation[key] = value
+        self._probation.move_to_end(key)
+        if len(self) > self.maxsize:
+            self._probation.popitem(last=False)
+            self.evictions += 1
+
+
+def _steps_cached(
+    number: int, dense: array, excursions: _SegmentedLRUCache
+) -> int:
+    """
+    Calculate the Collatz steps of number, caching the steps of every visited value.
+    """
+    # Walk the trajectory until reaching 1 or a value with known steps
+    path: list[int] = []
+    steps = 0
     while number > 1:
-        # Check if the result for this number is already cached
-        if number in __collatz_cache:
-            steps += __collatz_cache[number]
-            break
+        if number < len(dense):
+            if dense[number]:
+                steps = dense[number]
+                break
+        else:
+            cached = excursions.get(number)
+            if cached is not None:
+                steps = cached
+                break
 
-        # Do the Collatz step
+        path.append(number)
         if number % 2 == 0:
             number //= 2
         else:
             number = number * 3 + 1
+
+    # Each value on the path is one step further away from 1 than the next one
+    for value in reversed(path):
         steps += 1
+        if value < len(dense):
+            dense[value] = steps
+        else:
+            excursions.put(value, steps)
 
-    # Cache the result for the original number
-    __collatz_cache[original_number] = steps
     return steps
+
+
+# The cache used by steps(); it has no dense part, all values go into the LRU cache
+_NO_DENSE_CACHE = array("H")
+_steps_cache = _SegmentedLRUCache(STEPS_CACHE_SIZE)
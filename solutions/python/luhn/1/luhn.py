@@ -1,4 +1,4 @@
-from typing import Generator
+from collections.abc import Iterable
 
 
 class Luhn:
@@ -20,6 +20,8 @@ class Luhn:
     Methods:
         valid() -> bool:
             Returns True if the number is valid according to the Luhn formula, False otherwise.
+        valid_many(numbers) -> list[bool]:
+            Validates many numbers at once.
 
     Examples:
         >>> Luhn("4539 3195 0343 6467").valid()
@@ -33,45 +35,43 @@ class Luhn:
         self.card_num = card_num.replace(" ", "")
 
     def valid(self) -> bool:
-        return (
-            # Validate input: must be all digits and at least two digits
-            len(self.card_num) > 1
-            and self.card_num.isdigit()
-            and sum(
-                # Apply Luhn doubling logic
-                _luhn_doubling(
-                    # Get digits from right to left
-                    _digits_right_to_left(
-                        # Convert card number to integer for digit extraction
-                        int(self.card_num)
-                    )
-                )
-            )
-            % 10  # Valid if checksum is divisible by 10
-            == 0
-        )
-
-
-def _digits_right_to_left(num: int) -> Generator[int, None, None]:
-    """
-    Yield digits of num from right to left (ones to highest place).
-    Example: 123 -> yields 3, 2, 1
-    """
-    while num > 0:
-        yield num % 10
-        num //= 10
+        return _checksum_valid(self.card_num)
+
+    @staticmethod
+    def valid_many(numbers: Iterable[str]) -> list[bool]:
+        """
+        Validate many numbers at once, without creating a Luhn object for each.
+
+        Args:
+            numbers (Iterable[str]): The numbers to validate. Spaces are allowed and ignored.
+
+        Returns:
+            list[bool]: For each number, whether it is valid according to the Luhn formula.
 
+        Example:
+            >>> Luhn.valid_many(["4539 3195 0343 6467", "066 123 478"])
+            [True, False]
+        """
+        return [_checksum_valid(number.replace(" ", "")) for number in numbers]
 
-def _luhn_doubling(digits: Generator[int, None, None]) -> Generator[int, None, None]:
+
+# Maps each ASCII digit to the digit that replaces it when doubled:
+# 2 * d, minus 9 if that is greater than 9
+_DOUBLED_DIGITS = bytes.maketrans(b"0123456789", b"0246813579")
+
+
+def _checksum_valid(digits: str) -> bool:
     """
-    Apply Luhn doubling logic to a sequence of digits.
-    Every second digit (from the right) is doubled; if result > 9, subtract 9.
+    Check a number without spaces with the Luhn formula.
+
+    Works on the ASCII codes of the digits: every second digit from the right is
+    doubled with a translation table, and since each code is 48 more than its digit,
+    the digit sum is the sum of the codes minus 48 per digit. No int conversion needed.
     """
-    should_double: bool = False
-    for digit in digits:
-        if should_double:
-            # Double digit, subtract 9 if result > 9
-            yield digit * 2 - 9 if digit > 4 else digit * 2
-        else:
-            yield digit
-        should_double = not should_double
+    # Validate input: must be all (ASCII) digits and at least two digits
+    if len(digits) <= 1 or not (digits.isascii() and digits.isdigit()):
+        return False
+
+    codes = digits.encode()[::-1]  # right to left
+    total = sum(codes[::2]) + sum(codes[1::2].translate(_DOUBLED_DIGITS))
+    return (total - 48 * len(codes)) % 10 == 0
@@ -1,4 +1,186 @@
-primes: list[int] = [2, 3]
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, compress, islice
+from math import isqrt, log
+
+
+# Number of sieve flags per block; the table keeps a running count of primes per
+# block, so finding the kth prime only scans one block
+BLOCK_SIZE = 1 << 12
+
+
+class PrimeTable:
+    """
+    A thread-safe cache of the first primes in order, extended by sieving.
+
+    Primes are looked up in two places: a compact `array('Q')` of the first primes
+    (8 bytes per prime), and the flags of the last sieve (one byte per odd number) with
+    a running count of primes per block. Turning the flags into an array of primes costs
+    more than sieving, so it is only done for primes that are kept under `max_primes`
+    and when saving; the kth prime is found by counting flags instead.
+
+    Lookups never take a lock: extending the table builds new flags or a new array
+    under a lock and then swaps them in (copy-on-extend), so readers always see a
+    consistent table.
+
+    With `max_primes`, the table never holds more than that many primes. Requests
+    beyond the cap are answered from a fresh sieve, and only the smallest primes are
+    kept (the table must stay a prefix of the primes to be indexable).
+
+    A table can be saved to a file and loaded back memory-mapped, so worker processes
+    can share one warm table instead of each sieving their own.
+    """
+
+    def __init__(self, max_primes: int | None = None):
+        """
+        Initialize a new PrimeTable.
+
+        Args:
+            max_primes (int | None): The maximum number of primes to keep, or None for no limit.
+        """
+        self.max_primes = max_primes
+        self._primes: array | memoryview = array("Q", [2, 3])
+        # Flags of the odd numbers <= _sieved_limit and their running prime counts
+        # per block, or None if all cached primes are in _primes
+        self._sieved: tuple[bytearray, array] | None = None
+        # The table holds every prime <= _sieved_limit
+        self._sieved_limit: int = 3
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        sieved = self._sieved
+        if sieved is None:
+            return len(self._primes)
+        return max(len(self._primes), 1 + sieved[1][-1])
+
+    def nth(self, number: int) -> int:
+        """
+        Return the nth prime (1-based index), extending the table if needed.
+
+        Raises:
+            ValueError: If number is less than 1.
+        """
+        if number < 1:
+            raise ValueError("number must be at least 1")
+
+        # Fast path without locking: the table is never modified in place
+        table = self._primes
+        if number <= len(table):
+            return table[number - 1]
+        sieved = self._sieved
+        if sieved is not None and (p := _select(*sieved, number - 1)) is not None:
+            return p
+
+        with self._lock:
+            # Another thread may have extended the table in the meantime
+            table = self._primes
+            if number <= len(table):
+                return table[number - 1]
+            sieved = self._sieved
+            if sieved is not None and (p := _select(*sieved, number - 1)) is not None:
+                return p
+            return self._extend(number)
+
+    def _extend(self, number: int) -> int:
+        """
+        Sieve far enough to find the nth prime, cache the new primes (up to the cap),
+        and return the nth prime. Must be called with the lock held.
+
+        The sieve limit at least doubles on every extension, so a series of growing
+        requests costs amortised linear time.
+        """
+        limit = max(_upper_bound(number), 2 * self._sieved_limit)
+        is_prime = _sieve(limit)
+        counts = _block_counts(is_prime)
+        # The flags only cover the odd primes
+        result = _select(is_prime, counts, number - 1)
+
+        if self.max_primes is None:
+            self._sieved = (is_prime, counts)
+            self._sieved_limit = limit
+            return result
+
+        # Materialise only the primes that fit under the cap; the table then
+        # covers up to its last prime
+        table = self._primes
+        if len(table) < self.max_primes:
+            first = (self._sieved_limit + 1) // 2
+            new_primes = array(
+                "Q",
+                islice(
+                    compress(
+                        range(2 * first + 1, limit + 1, 2), memoryview(is_prime)[first:]
+                    ),
+                    self.max_primes - len(table),
+                ),
+            )
+            if new_primes:
+                extended = array("Q")
+                extended.frombytes(memoryview(table).cast("B"))
+                extended.extend(new_primes)
+                self._primes = extended
+                if len(extended) < self.max_primes:
+                    self._sieved_limit = limit
+                else:
+                    self._sieved_limit = new_primes[-1]
+
+        return result
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write the table to a file (the raw 8-byte primes in native byte order).
+        """
+        table = self._primes
+        sieved = self._sieved
+        with open(path, "wb") as f:
+            f.write(table)
+            if sieved is None:
+                return
+
+            # Append the sieved primes beyond the array, one block at a time
+            is_prime = sieved[0]
+            for start in range(table[-1] // 2 + 1, len(is_prime), BLOCK_SIZE):
+                stop = min(start + BLOCK_SIZE, len(is_prime))
+                f.write(
+                    array(
+                        "Q",
+                        compress(
+                            range(2 * start + 1, 2 * stop, 2), is_prime[start:stop]
+                        ),
+                    )
+                )
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], max_primes: int | None = None
+    ) -> "PrimeTable":
+        """
+        Load a table saved with `save`.
+
+        The file is memory-mapped read-only, so loading is instant and processes that
+        load the same file share its pages. The mapping is replaced by an in-memory
+        copy once the table needs to grow.
+        """
+        table = cls(max_primes)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return table
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        primes = memoryview(mapped).cast("Q")
+        if max_primes is not None:
+            primes = primes[:max_primes]
+        if len(primes) > len(table._primes):
+            table._primes = primes
+            table._sieved_limit = primes[-1]
+        return table
+
+
+# Table used by prime(); replace it with PrimeTable.load(...) to start warm
+prime_table = PrimeTable()
 
 
 def prime(number: int) -> int:
@@ -23,19 +205,72 @@ def prime(number: int) -> int:
     if number < 0:
         raise ValueError("number must not be negative")
 
-    # Start searching for primes from the last known prime
-    candidate = primes[-1]
-    # Continue until we have found enough primes
-    while len(primes) < number:
-        candidate += 2  # Only check odd numbers (even numbers > 2 are not prime)
-        sqrtNum = int(candidate**0.5)  # Calculate square root for optimization
-        for factor in [p for p in primes if p <= sqrtNum]:
-            if candidate % factor == 0:
-                # If divisible by any known prime, candidate is not prime
-                break
-        else:
-            # If no factors up to sqrt(candidate), candidate is prime
-            primes.append(candidate)
-
-    # Return the nth prime (1-based index)
-    return primes[number - 1]
+    return prime_table.nth(number)
+
+
+def _upper_bound(n: int) -> int:
+    """
+    Upper bound for the nth prime.
+
+    For n >= 6, the nth prime is less than n * (ln n + ln ln n) (Rosser's theorem).
+    """
+    if n < 6:
+        return 13  # the 6th prime
+    return int(n * (log(n) + log(log(n)))) + 1
+
+
+def _sieve(limit: int) -> bytearray:
+    """
+    Sieve the odd numbers <= limit using the Sieve of Eratosthenes.
+
+    Returns:
+        bytearray: Flag i is 1 if the odd number 2i + 1 is prime, 0 otherwise.
+    """
+    is_prime = bytearray([1]) * (limit // 2 + 1)
+    is_prime[0] = 0  # 1 is not a prime
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if is_prime[i]:
+            p = 2 * i + 1
+            # Multiples below p^2 have a smaller prime factor and are already marked
+            start = p * p // 2
+            is_prime[start::p] = bytes(len(range(start, len(is_prime), p)))
+
+    return is_prime
+
+
+def _block_counts(is_prime: bytearray) -> array:
+    """
+    Count the primes in the sieve flags block by block.
+
+    Returns:
+        array: Entry b is the number of flags set in is_prime[: (b + 1) * BLOCK_SIZE].
+    """
+    return array(
+        "Q",
+        accumulate(
+            is_prime.count(1, start, start + BLOCK_SIZE)
+            for start in range(0, len(is_prime), BLOCK_SIZE)
+        ),
+    )
+
+
+def _select(is_prime: bytearray, counts: array, k: int) -> int | None:
+    """
+    Return the kth odd prime (1-based) in the sieve flags, or None if there are fewer.
+
+    The running counts locate the block holding it, so only that block is scanned.
+    """
+    block = bisect_left(counts, k)
+    if block == len(counts):
+        return None
+
+    start = block * BLOCK_SIZE
+    before = counts[block - 1] if block else 0
+    index = next(
+        islice(
+            compress(range(start, start + BLOCK_SIZE), is_prime[start : start + BLOCK_SIZE]),
+            k - before - 1,
+            None,
+        )
+    )
+    return 2 * index + 1
@@ -1,16 +1,38 @@
-from collections.abc import Callable
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from math import isqrt
 
+# Up to this many factors, walking the factor pairs beats generating palindromes
+PAIR_WALK_MAX_FACTORS = 25
 
-def largest(max_factor: int, min_factor: int = 0) -> tuple[int | None, list[list[int]]]:
+# Number of palindrome halves (i.e. palindromes) per block in the parallel search
+PARALLEL_BLOCK_SIZE = 1 << 10
+
+
+def largest(
+    max_factor: int, min_factor: int = 0, workers: int = 1
+) -> tuple[int | None, list[list[int]]]:
     """Given a range of numbers, find the largest palindromes which
        are products of two numbers within that range.
 
     :param min_factor: int with a default value of 0
     :param max_factor: int
+    :param workers: int, number of processes to search the palindromes with.
+             The first block of palindromes is always searched in the calling process,
+             so a pool is only started when the answer is not among the largest palindromes.
     :return: tuple of (palindrome, iterable).
              Iterable should contain both factors of the palindrome in an arbitrary order.
     """
-    return _get_with_pairs(min_factor, max_factor, _get_max)
+    if max_factor - min_factor < PAIR_WALK_MAX_FACTORS:
+        return _get_with_pairs(min_factor, max_factor, _get_max)
+    if workers > 1:
+        return _get_with_pairs(
+            min_factor, max_factor, partial(_get_max_parallel, workers=workers)
+        )
+    return _get_with_pairs(min_factor, max_factor, _get_max_by_palindromes)
 
 
 def smallest(
@@ -24,7 +46,9 @@ def smallest(
     :return: tuple of (palindrome, iterable).
     Iterable should contain both factors of the palindrome in an arbitrary order.
     """
-    return _get_with_pairs(min_factor, max_factor, _get_min)
+    if max_factor - min_factor < PAIR_WALK_MAX_FACTORS:
+        return _get_with_pairs(min_factor, max_factor, _get_min)
+    return _get_with_pairs(min_factor, max_factor, _get_min_by_palindromes)
 
 
 def _get_with_pairs(
@@ -58,6 +82,104 @@ def _get_max(min_factor: int, max_factor: int) -> int | None:
     return max_palindrome if max_palindrome else None
 
 
+def _get_max_parallel(min_factor: int, max_factor: int, workers: int) -> int | None:
+    """Find largest palindrome like _get_max_by_palindromes, testing blocks of palindromes in a process pool.
+
+    Blocks are submitted from the largest palindromes down, and their results are
+    taken in that order, so the first block with a palindrome product holds the answer.
+    The workers share the largest palindrome found so far, so blocks of smaller
+    palindromes that are still running can stop early.
+    """
+    if max_factor >= 1 << 32:
+        # Products would not fit into the shared unsigned 64-bit value
+        return _get_max_by_palindromes(min_factor, max_factor)
+
+    blocks = _palindrome_blocks(min_factor**2, max_factor**2, PARALLEL_BLOCK_SIZE)
+
+    # The answer is usually among the largest palindromes: try them before starting a pool
+    first_block = next(blocks, None)
+    if first_block is None:
+        return None
+    result = _search_block(first_block, min_factor, max_factor)
+    if result is not None:
+        return result
+
+    best = multiprocessing.Value("Q", 0)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_shared_best, initargs=(best,)
+    ) as executor:
+        # Keep a bounded window of blocks in flight, taking results in order
+        window = 2 * workers
+        pending: deque[Future[int | None]] = deque()
+        for block in blocks:
+            pending.append(
+                executor.submit(_search_block, block, min_factor, max_factor)
+            )
+            if len(pending) >= window:
+                result = pending.popleft().result()
+                if result is not None:
+                    break
+        while result is None and pending:
+            result = pending.popleft().result()
+
+        # Blocks of smaller palindromes are not needed anymore
+        for future in pending:
+            future.cancel()
+
+    return result
+
+
+def _palindrome_blocks(
+    lo: int, hi: int, size: int
+) -> Generator[tuple[int, int], None, None]:
+    """Split the palindromes in [lo, hi] into ranges of at most size palindromes, largest first."""
+    for length in range(len(str(hi)), len(str(lo)) - 1, -1):
+        half_len = (length + 1) // 2
+        first_half = 0 if length == 1 else 10 ** (half_len - 1)
+        last_half = 10**half_len - 1
+        if length == len(str(hi)):
+            last_half = int(str(hi)[:half_len])
+
+        for start in range(last_half, first_half - 1, -size):
+            end = max(start - size + 1, first_half)
+            block_hi = _mirror(start, length)
+            if block_hi < lo:
+                return
+            block_lo = _mirror(end, length)
+            if block_lo <= hi:
+                yield max(block_lo, lo), min(block_hi, hi)
+
+
+# Largest palindrome found so far by any worker, set up by _init_shared_best
+_shared_best = None
+
+
+def _init_shared_best(best) -> None:
+    """Worker initializer: keep a reference to the shared best palindrome."""
+    global _shared_best
+    _shared_best = best
+
+
+def _search_block(
+    block: tuple[int, int], min_factor: int, max_factor: int
+) -> int | None:
+    """Find the largest palindrome in [block[0], block[1]] with a factor pair, sharing the best palindrome."""
+    block_lo, block_hi = block
+    for palindrome in _palindromes(block_lo, block_hi, descending=True):
+        # Another worker may have found a larger palindrome in the meantime
+        if _shared_best is not None and palindrome <= _shared_best.value:
+            return None
+
+        if _has_factor_pair(palindrome, min_factor, max_factor):
+            if _shared_best is not None:
+                with _shared_best.get_lock():
+                    if palindrome > _shared_best.value:
+                        _shared_best.value = palindrome
+            return palindrome
+
+    return None
+
+
 def _get_min(min_factor: int, max_factor: int) -> int | None:
     """Find smallest palindrome by iterating through factor pairs in optimal order."""
     inf = max_factor**2 + 1
@@ -78,6 +200,89 @@ def _get_min(min_factor: int, max_factor: int) -> int | None:
     return min_palindrome if min_palindrome < inf else None
 
 
+def _get_max_by_palindromes(min_factor: int, max_factor: int) -> int | None:
+    """Find largest palindrome by testing palindromes in descending order for a factor pair."""
+    for palindrome in _palindromes(min_factor**2, max_factor**2, descending=True):
+        if _has_factor_pair(palindrome, min_factor, max_factor):
+            return palindrome
+    return None
+
+
+def _get_min_by_palindromes(min_factor: int, max_factor: int) -> int | None:
+    """Find smallest palindrome by testing palindromes in ascending order for a factor pair."""
+    for palindrome in _palindromes(min_factor**2, max_factor**2, descending=False):
+        if _has_factor_pair(palindrome, min_factor, max_factor):
+            return palindrome
+    return None
+
+
+def _palindromes(lo: int, hi: int, descending: bool) -> Generator[int, None, None]:
+    """Generate all palindromes in [lo, hi] in order, built from their first half of digits."""
+    if descending:
+        lengths = range(len(str(hi)), len(str(lo)) - 1, -1)
+    else:
+        lengths = range(len(str(lo)), len(str(hi)) + 1)
+
+    for length in lengths:
+        # Halves of palindromes with this number of digits (0 is the only one starting with 0)
+        half_len = (length + 1) // 2
+        first_half = 0 if length == 1 else 10 ** (half_len - 1)
+        last_half = 10**half_len - 1
+
+        # Start from the halves of the bounds to skip palindromes out of range
+        if descending:
+            if length == len(str(hi)):
+                last_half = int(str(hi)[:half_len])
+            halves = range(last_half, first_half - 1, -1)
+        else:
+            if length == len(str(lo)):
+                first_half = int(str(lo)[:half_len])
+            halves = range(first_half, last_half + 1)
+
+        for half in halves:
+            palindrome = _mirror(half, length)
+            if palindrome < lo:
+                if descending:
+                    return
+                continue
+            if palindrome > hi:
+                if descending:
+                    continue
+                return
+            yield palindrome
+
+
+def _mirror(half: int, length: int) -> int:
+    """Build the palindrome with the given number of digits from its first half."""
+    digits = str(half)
+    # Mirror the half, without repeating the middle digit for odd lengths
+    return int(digits + digits[-1 - length % 2 :: -1])
+
+
+def _has_factor_pair(prod: int, min_factor: int, max_factor: int) -> bool:
+    """Check whether prod is the product of two factors in [min_factor, max_factor]."""
+    if prod == 0:
+        return min_factor == 0
+
+    # The smaller factor is at least prod / max_factor and at most sqrt(prod)
+    low = max(min_factor, -(-prod // max_factor))
+    high = min(max_factor, isqrt(prod))
+    if low > high:
+        return False
+
+    if len(str(prod)) % 2 == 0:
+        # Palindromes with an even number of digits are divisible by 11, so one of the
+        # factors is; only try multiples of 11 (as either the smaller or larger factor)
+        first = -(-low // 11) * 11
+        return any(
+            prod % factor == 0 and min_factor <= prod // factor <= max_factor
+            for factor in range(max_factor // 11 * 11, first - 1, -11)
+        )
+
+    # Try the smaller factor from sqrt(prod) down; factors near the root are most likely
+    return any(prod % factor == 0 for factor in range(high, low - 1, -1))
+
+
 def _is_palindrome(num: int) -> bool:
     """Check if a number is a palindrome without string conversion for better performance."""
     # Handle negative numbers, single digits, and numbers ending in 0
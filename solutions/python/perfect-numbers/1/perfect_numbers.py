@@ -1,3 +1,12 @@
+from array import array
+from collections.abc import Iterator
+from itertools import compress
+from math import isqrt
+
+# From this size on, classify() computes the aliquot sum from the prime factorisation
+FACTORISATION_THRESHOLD = 1_000_000
+
+
 def classify(number: int) -> str:
     """
     A perfect number equals the sum of its positive divisors.
@@ -18,7 +27,40 @@ def classify(number: int) -> str:
     if number < 1:
         raise ValueError("Classification is only possible for positive integers.")
 
-    aliquot_sum = _get_aliquot_sum(number)
+    if number >= FACTORISATION_THRESHOLD:
+        aliquot_sum = _get_aliquot_sum_from_factors(number)
+    else:
+        aliquot_sum = _get_aliquot_sum(number)
+    return _label(number, aliquot_sum)
+
+
+def classify_range(limit: int) -> tuple[dict[str, int], Iterator[str]]:
+    """
+    Classify every integer from 1 to limit at once.
+
+    The divisor sums of all numbers are computed together with a multiplicative sieve
+    over a table of smallest prime factors, and stored in a compact integer array.
+
+    Args:
+        limit (int): The largest number to classify.
+
+    Returns:
+        tuple[dict[str, int], Iterator[str]]: The number of "perfect", "abundant" and
+            "deficient" integers up to limit, and an iterator over the classifications
+            of 1, 2, ..., limit.
+    """
+    sigma = _divisor_sums(limit)
+
+    counts = {"perfect": 0, "abundant": 0, "deficient": 0}
+    for n in range(1, limit + 1):
+        counts[_label(n, sigma[n] - n)] += 1
+
+    labels = (_label(n, sigma[n] - n) for n in range(1, limit + 1))
+    return counts, labels
+
+
+def _label(number: int, aliquot_sum: int) -> str:
+    """Return the classification of a number given its aliquot sum."""
     if aliquot_sum == number:
         return "perfect"
     elif aliquot_sum > number:
@@ -61,3 +103,89 @@ def _get_aliquot_sum(n: int) -> int:
 
     # Return the sum of all proper divisors (aliquot sum)
     return sum_divisors
+
+
+def _get_aliquot_sum_from_factors(n: int) -> int:
+    """
+    Calculate the aliquot sum of n from its prime factorisation.
+
+    The divisor sum is multiplicative: for n = p1^a1 * ... * pk^ak it is the product of
+    (1 + p + ... + p^a) over the prime powers. Trial division stops as soon as the
+    remaining cofactor is prime, so numbers with small factors are fast.
+    """
+    sigma = 1
+    remaining = n
+    p = 2
+    while p * p <= remaining:
+        if remaining % p == 0:
+            # Sum of the powers of p dividing n: 1 + p + p^2 + ...
+            power_sum = 1
+            power = 1
+            while remaining % p == 0:
+                remaining //= p
+                power *= p
+                power_sum += power
+            sigma *= power_sum
+        p += 1 if p == 2 else 2  # after 2, only odd candidates
+
+    if remaining > 1:
+        # What is left is a prime factor
+        sigma *= 1 + remaining
+
+    return sigma - n
+
+
+def _divisor_sums(limit: int) -> array:
+    """
+    Return an array whose entry n is the sum of all divisors of n (for 1 <= n <= limit).
+
+    With p the smallest prime factor of n and m = n / p, the divisor sum satisfies
+    sigma(n) = (p + 1) * sigma(m) if p does not divide m, and
+    sigma(n) = (p + 1) * sigma(m) - p * sigma(m / p) otherwise.
+    """
+    spf = _smallest_prime_factors(limit)
+
+    # sigma(n) < 6n in this range, so 32-bit entries suffice for limits below ~7 * 10^8
+    sigma = array("I" if 6 * limit < 2**32 else "Q", [0]) * (limit + 1)
+    if limit >= 1:
+        sigma[1] = 1
+    for n in range(2, limit + 1):
+        p = spf[n]
+        m = n // p
+        if m % p:
+            sigma[n] = (p + 1) * sigma[m]
+        else:
+            sigma[n] = (p + 1) * sigma[m] - p * sigma[m // p]
+
+    return sigma
+
+
+def _smallest_prime_factors(n: int) -> array:
+    """
+    Return an array whose entry i is the smallest prime factor of i (for 2 <= i <= n).
+
+    The multiples of each prime p <= sqrt(n) are overwritten with p by slice assignment,
+    going from the largest prime down, so the smallest prime factor is written last.
+    Numbers that are never overwritten are prime and keep their own value.
+    """
+    spf = array("I", range(n + 1))
+
+    # The primes up to sqrt(n), using an odd-only sieve where index i stands for 2i + 1
+    root = isqrt(n)
+    is_prime = bytearray([1]) * (root // 2 + 1)
+    is_prime[0] = 0  # 1 is not a prime
+    for i in range(1, (isqrt(root) - 1) // 2 + 1):
+        if is_prime[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            is_prime[start::p] = bytes(len(range(start, len(is_prime), p)))
+    primes = list(compress(range(1, root + 1, 2), is_prime))
+    if root >= 2:
+        primes.insert(0, 2)
+
+    for p in reversed(primes):
+        # Multiples below p^2 have a smaller prime factor
+        count = len(range(p * p, n + 1, p))
+        spf[p * p :: p] = array("I", [p]) * count
+
+    return spf
@@ -1,6 +1,12 @@
+import random
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import IntEnum
 from functools import total_ordering
+from itertools import combinations, combinations_with_replacement, islice
+from math import comb
 
 
 def best_hands(hands: list[str]) -> list[str]:
@@ -15,17 +21,121 @@ def best_hands(hands: list[str]) -> list[str]:
     if not hands:
         return []
 
-    # Start with the first hand as the current best,
-    # then compare each remaining hand to the current best
-    best: list[Hand] = [Hand(hands[0])]
-    for hand in hands[1:]:
-        h = Hand(hand)
-        if best[0] < h:
-            best = [h]
-        elif not (h < best[0]):  # tie
-            best.append(h)
+    # Each hand maps to a single comparable integer, so the winners are
+    # simply the hands sharing the maximum strength (in input order)
+    strengths = [_evaluate(*_parse_codes(hand)) for hand in hands]
+    best = max(strengths)
+    return [hand for hand, strength in zip(hands, strengths) if strength == best]
 
-    return [str(hand) for hand in best]
+
+def best_five(cards: str) -> str:
+    """Return the best 5-card hand that can be made from five or more cards.
+
+    Args:
+        cards: Cards as a string, e.g. two hole cards plus the board in
+            Texas Hold'em ("AS KS QS JS 10S 2H 3D")
+
+    Returns:
+        The best five of the given cards as a hand string.
+    """
+    card_strs = cards.split()
+    if len(card_strs) < Hand._NUM_CARDS:
+        raise ValueError(
+            f"Need at least {Hand._NUM_CARDS} cards, got {len(card_strs)}"
+        )
+    codes = _card_codes(card_strs)
+    best = max(
+        combinations(range(len(codes)), Hand._NUM_CARDS),
+        key=lambda idx: _evaluate(*[codes[i] for i in idx]),
+    )
+    return " ".join(card_strs[i] for i in best)
+
+
+@dataclass(frozen=True)
+class Equity:
+    """Outcome of an equity calculation.
+
+    win[i] is the probability that player i wins outright, tie[i] the
+    probability that player i shares the pot with at least one other player.
+    """
+
+    win: list[float]
+    tie: list[float]
+    boards: int
+    hands_per_second: float
+
+
+def equity(
+    players: list[str],
+    board: str = "",
+    samples: int | None = None,
+    seed: int = 0,
+    workers: int | None = None,
+) -> Equity:
+    """Compute Texas Hold'em win/tie probabilities for each player.
+
+    The missing board cards are either enumerated exhaustively or, if
+    `samples` is given, drawn at random. The work is split into fixed-size
+    chunks that run on a process pool; every sampled chunk has its own seed
+    derived from `seed`, so results don't depend on the number of workers.
+
+    Args:
+        players: Each player's two hole cards as a string (e.g. "AS KD")
+        board: Zero to five community cards already dealt
+        samples: Number of random boards to evaluate, or None to enumerate
+            every possible board
+        seed: Seed for the random board sampling
+        workers: Number of worker processes (None for one per CPU,
+            1 to run in the calling process)
+
+    Returns:
+        The win and tie probabilities per player, the number of boards
+        evaluated, and the evaluation throughput in hands per second.
+    """
+    holes = [_card_codes(hole.split()) for hole in players]
+    if any(len(hole) != 2 for hole in holes):
+        raise ValueError("Each player must have exactly 2 hole cards")
+    board_codes = _card_codes(board.split())
+    if len(board_codes) > _BOARD_CARDS:
+        raise ValueError(f"Board must have at most {_BOARD_CARDS} cards")
+
+    used = [code for hole in holes for code in hole] + board_codes
+    if len(set(used)) != len(used):
+        raise ValueError("Duplicate cards")
+    deck = [code for code in range(len(_CARD_CODES)) if code not in used]
+    missing = _BOARD_CARDS - len(board_codes)
+
+    # Fixed-size chunks: (first board index, number of boards)
+    total = comb(len(deck), missing) if samples is None else samples
+    chunks = [
+        (start, min(_EQUITY_CHUNK, total - start))
+        for start in range(0, total, _EQUITY_CHUNK)
+    ]
+    args = (holes, board_codes, deck, missing, samples is not None, seed)
+
+    begin = time.perf_counter()
+    if workers == 1:
+        results = [_equity_chunk(*args, *chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_equity_chunk, *zip(*[args + chunk for chunk in chunks]))
+            )
+    elapsed = time.perf_counter() - begin
+
+    wins = [0] * len(holes)
+    ties = [0] * len(holes)
+    for chunk_wins, chunk_ties in results:
+        for i in range(len(holes)):
+            wins[i] += chunk_wins[i]
+            ties[i] += chunk_ties[i]
+
+    return Equity(
+        win=[w / total if total else 0.0 for w in wins],
+        tie=[t / total if total else 0.0 for t in ties],
+        boards=total,
+        hands_per_second=total * len(holes) / elapsed if elapsed else 0.0,
+    )
 
 
 class Category(IntEnum):
@@ -40,52 +150,36 @@ class Category(IntEnum):
     STRAIGHT_FLUSH = 9
 
 
+_RANK_STRS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+_SUIT_STRS = "CDHS"
+
+
 class Rank(int):
     """Custom int subclass for card ranks with string parsing and display.
 
     Ranks: 2-10 (numeric), J=11, Q=12, K=13, A=14
+    There is exactly one instance per rank; parsing is a dictionary lookup.
     """
 
-    def __new__(cls, rank_str: str) -> int:
-        # Convert string representation to numeric value
-        value = Rank._from_str(rank_str)
-        if not (2 <= value <= 14):
-            raise ValueError(f"Invalid rank: {value}")
-        return super().__new__(cls, value)
-
-    @staticmethod
-    def _from_str(s: str) -> int:
-        """Convert string rank to numeric value."""
-        if s.isdigit():
-            return int(s)
-        match s:
-            case "J":
-                return 11
-            case "Q":
-                return 12
-            case "K":
-                return 13
-            case "A":
-                return 14
-            case _:
-                raise ValueError(f"Invalid rank: {s}")
+    __slots__ = ()
+
+    def __new__(cls, rank_str: str) -> "Rank":
+        try:
+            return _RANKS[rank_str]
+        except KeyError:
+            raise ValueError(f"Invalid rank: {rank_str}") from None
 
     def __str__(self) -> str:
         """Convert numeric rank back to string representation."""
-        match self:
-            case 11:
-                return "J"
-            case 12:
-                return "Q"
-            case 13:
-                return "K"
-            case 14:
-                return "A"
-            case _:
-                # For ranks 2-10, use the numeric value
-                return super().__str__()
+        return _RANK_STRS[self - 2]
 
 
+# The interned ranks, keyed by their string representation
+_RANKS: dict[str, Rank] = {
+    rank_str: int.__new__(Rank, value)
+    for value, rank_str in enumerate(_RANK_STRS, start=2)
+}
+
 ACE = Rank("A")
 
 # A-2-3-4-5 straight (wheel) - Ace plays low
@@ -94,7 +188,21 @@ WHEEL_STRAIGHT = [ACE, 5, 4, 3, 2]
 
 @total_ordering
 class Hand:
-    """Represents a poker hand with comparison and categorization logic."""
+    """Represents a poker hand with comparison and categorization logic.
+
+    The category and all tie-breaking ranks are computed once at construction
+    and stored as a single tuple, so comparing hands is a tuple comparison.
+    """
+
+    __slots__ = (
+        "_s",
+        "_cards",
+        "_rank_counts",
+        "most_common_rank",
+        "most_common_count",
+        "_is_wheel",
+        "_key",
+    )
 
     _NUM_CARDS = 5
 
@@ -110,18 +218,30 @@ class Hand:
 
         # Sort cards by rank (highest first) for easier comparison
         self._cards: list[Card] = sorted(cards, reverse=True)
-        self._ranks: list[int] = [c.rank for c in self._cards]
+        ranks: list[int] = [c.rank for c in self._cards]
 
-        # Count occurrences of each rank for pattern detection
-        self._rank_counts = Counter(self._ranks).most_common()
+        # Count occurrences of each rank for pattern detection.
+        # Ranks with equal counts keep their (descending) order.
+        self._rank_counts = Counter(ranks).most_common()
         self.most_common_rank, self.most_common_count = self._rank_counts[0]
 
+        # Check if this is a wheel straight (A-2-3-4-5), where Ace plays low (as 1)
+        self._is_wheel: bool = ranks == WHEEL_STRAIGHT
+
+        # Sort key: the category followed by the ranks that break ties within it
+        category = self._categorize(ranks)
+        if category in (Category.STRAIGHT_FLUSH, Category.STRAIGHT):
+            # Only the top card matters; in a wheel that is the five
+            tie_break = [5 if self._is_wheel else ranks[0]]
+        else:
+            # Ranks ordered by how often they occur, then from highest to lowest
+            tie_break = [rank for rank, _ in self._rank_counts]
+        self._key: tuple[int, ...] = (category, *tie_break)
+
     @property
     def pairs(self) -> list[int]:
         """Return ranks that appear exactly twice, sorted high to low."""
-        return sorted(
-            [rank for rank, count in self._rank_counts if count == 2], reverse=True
-        )
+        return [rank for rank, count in self._rank_counts if count == 2]
 
     @property
     def triple(self) -> int:
@@ -141,6 +261,15 @@ class Hand:
     @property
     def category(self) -> Category:
         """The poker hand category (pair, straight, etc.)."""
+        return self._key[0]
+
+    @property
+    def key(self) -> tuple[int, ...]:
+        """The sort key of this hand: category followed by tie-breaking ranks."""
+        return self._key
+
+    def _categorize(self, ranks: list[int]) -> Category:
+        """Determine the poker hand category from the sorted ranks."""
 
         # Check for patterns based on rank counts first (most common cases)
         if self.quad:
@@ -158,99 +287,33 @@ class Hand:
         suit = self._cards[0].suit
         same_suit = all(suit == c.suit for c in self._cards[1:])
 
+        # Straight: each card 1 less than previous (cards sorted high to low),
+        # or the special case A-2-3-4-5 (wheel/bicycle straight)
+        is_straight = ranks[0] - ranks[-1] == Hand._NUM_CARDS - 1 or self._is_wheel
+
         if same_suit:
-            if self._is_straight:
+            if is_straight:
                 return Category.STRAIGHT_FLUSH
             else:
                 return Category.FLUSH
-        elif self._is_straight:
+        elif is_straight:
             return Category.STRAIGHT
 
         # No special patterns found
         return Category.HIGH_CARD
 
-    @property
-    def _is_straight(self) -> bool:
-        """Check if cards form a sequence (straight)."""
-        return (
-            # Normal straight: each card 1 less than previous (cards sorted high to low)
-            all(
-                self._ranks[i] - 1 == self._ranks[i + 1]
-                for i in range(Hand._NUM_CARDS - 1)
-            )
-            # Check for special case: A-2-3-4-5 (wheel/bicycle straight)
-            or self._is_wheel
-        )
-
-    @property
-    def _is_wheel(self) -> bool:
-        """Check if this is a wheel straight (A-2-3-4-5).
-
-        In this special straight, Ace plays low (as 1).
-        """
-        return self._ranks == WHEEL_STRAIGHT
-
     def __str__(self) -> str:
         return self._s
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Hand):
             return NotImplemented
-
-        # First compare by hand category (straight flush > four of a kind > etc.)
-        category = self.category
-        if category != other.category:
-            return self.category < other.category
-
-        # Same category - need to compare within category
-        match category:
-            case Category.STRAIGHT_FLUSH | Category.STRAIGHT:
-                # Wheel straight (A-2-3-4-5) loses to any other straight
-                self_is_wheel = self._is_wheel
-                if self_is_wheel is not other._is_wheel:
-                    return self_is_wheel
-            case Category.FOUR_OF_A_KIND:
-                # Compare the rank of the four cards first
-                if self.quad != other.quad:
-                    return self.quad < other.quad
-                # If same quad rank, compare kickers
-                return self.kicker < other.kicker
-            case Category.FULL_HOUSE:
-                # Compare triple first, then pair
-                return (
-                    self.triple < other.triple
-                    if self.triple != other.triple
-                    else self.pairs[0] < other.pairs[0]
-                )
-            case Category.FLUSH:
-                # Tie-breaking for flush is handled by comparing card ranks below
-                pass
-            case Category.THREE_OF_A_KIND:
-                # Compare the rank of the three cards
-                if self.triple != other.triple:
-                    return self.triple < other.triple
-            case Category.ONE_PAIR | Category.TWO_PAIRS:
-                # Compare pairs from highest to lowest
-                for self_pair, other_pair in zip(self.pairs, other.pairs):
-                    if self_pair != other_pair:
-                        return self_pair < other_pair
-            case _:
-                # HIGH_CARD case - fall through to card comparison
-                pass
-
-        # Tie-breaker: compare cards from highest to lowest
-        for i in range(Hand._NUM_CARDS):
-            if self._cards[i] == other._cards[i]:
-                continue
-            return self._cards[i] < other._cards[i]
-
-        # Hands are identical
-        return False
+        return self._key < other._key
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Hand):
             return NotImplemented
-        return not (self < other) and not (other < self)
+        return self._key == other._key
 
 
 @total_ordering
@@ -258,18 +321,27 @@ class Card:
     """Represents a playing card with rank and suit.
 
     Cards are ordered by rank only (2 < 3 < ... < J < Q < K < A).
+    There is exactly one instance per card; parsing is a dictionary lookup.
     """
 
-    def __init__(self, s: str) -> None:
-        if len(s) < 2:
-            raise ValueError(f"Invalid card format: {s}")
+    __slots__ = ("rank", "suit")
+
+    rank: Rank
+    suit: str
 
-        # Parse rank (all characters except the last) and suit (last character)
-        self.rank = Rank(s[:-1])
-        self.suit = s[-1]
+    def __new__(cls, s: str) -> "Card":
+        try:
+            return _CARDS[s]
+        except KeyError:
+            raise ValueError(f"Invalid card format: {s}") from None
 
-        if self.suit not in "CDHS":
-            raise ValueError(f"Invalid suit: {self.suit}")
+    @classmethod
+    def _intern(cls, rank: Rank, suit: str) -> "Card":
+        """Create the single instance of a card (bypasses the lookup in __new__)."""
+        card = object.__new__(cls)
+        card.rank = rank
+        card.suit = suit
+        return card
 
     def __str__(self) -> str:
         return str(self.rank) + self.suit
@@ -287,3 +359,192 @@ class Card:
 
         # Cards are equal if they have the same rank (suit doesn't matter)
         return self.rank == other.rank
+
+
+# The 52 interned cards, keyed by their string representation (e.g. "10H")
+_CARDS: dict[str, Card] = {
+    rank_str + suit: Card._intern(rank, suit)
+    for rank_str, rank in _RANKS.items()
+    for suit in _SUIT_STRS
+}
+
+
+# --- Integer evaluation engine ---------------------------------------------
+#
+# The `Hand` class above is the readable reference implementation. For bulk
+# evaluation, every card is encoded as a small int (rank index * 4 + suit
+# index) and every 5-card hand is mapped to one comparable integer strength
+# with two lookup tables built once at import time:
+# - flushes are keyed by the 13-bit mask of their (necessarily distinct) ranks
+# - all other hands are keyed by the product of one prime per card rank,
+#   which is unique for every rank multiset
+
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Card string (e.g. "10H") to card code in range(52)
+_CARD_CODES: dict[str, int] = {
+    rank + suit: rank_idx * 4 + suit_idx
+    for rank_idx, rank in enumerate(_RANK_STRS)
+    for suit_idx, suit in enumerate(_SUIT_STRS)
+}
+
+
+def _parse_codes(s: str) -> list[int]:
+    """Parse a hand string into a list of card codes."""
+    cards = s.split()
+    if len(cards) != Hand._NUM_CARDS:
+        raise ValueError(
+            f"Hand must have exactly {Hand._NUM_CARDS} cards, got {len(cards)}"
+        )
+    codes = _card_codes(cards)
+    # The lookup tables only cover hands of five different cards
+    if len(set(codes)) != len(codes):
+        raise ValueError("Duplicate cards")
+    return codes
+
+
+def _card_codes(cards: list[str]) -> list[int]:
+    """Convert card strings into card codes."""
+    try:
+        return [_CARD_CODES[c] for c in cards]
+    except KeyError as e:
+        raise ValueError(f"Invalid card format: {e.args[0]}") from None
+
+
+def _strength(category: Category, ranks: list[int]) -> int:
+    """Pack a category and its tie-break ranks (most significant first) into an int.
+
+    Ranks are 2-14, so each fits in one hexadecimal digit.
+    """
+    strength = int(category)
+    for i in range(Hand._NUM_CARDS):
+        strength = strength << 4 | (ranks[i] if i < len(ranks) else 0)
+    return strength
+
+
+def _build_tables() -> tuple[dict[int, int], dict[int, int]]:
+    """Compute the strength of every 5-card rank multiset.
+
+    Returns:
+        Tuple of (flush strengths keyed by rank mask,
+        non-flush strengths keyed by rank prime product).
+    """
+    flushes: dict[int, int] = {}
+    unsuited: dict[int, int] = {}
+
+    for combo in combinations_with_replacement(range(len(_RANK_STRS)), 5):
+        counts = Counter(combo)
+        if max(counts.values()) > 4:
+            continue  # five of a kind needs more than four suits
+
+        # Order ranks by how often they occur, then by rank (both descending)
+        grouped = sorted(counts.items(), key=lambda rc: (rc[1], rc[0]), reverse=True)
+        ranks = [rank_idx + 2 for rank_idx, _ in grouped]
+        pattern = [count for _, count in grouped]
+
+        product = 1
+        for rank_idx in combo:
+            product *= _RANK_PRIMES[rank_idx]
+
+        match pattern:
+            case [4, 1]:
+                unsuited[product] = _strength(Category.FOUR_OF_A_KIND, ranks)
+            case [3, 2]:
+                unsuited[product] = _strength(Category.FULL_HOUSE, ranks)
+            case [3, 1, 1]:
+                unsuited[product] = _strength(Category.THREE_OF_A_KIND, ranks)
+            case [2, 2, 1]:
+                unsuited[product] = _strength(Category.TWO_PAIRS, ranks)
+            case [2, 1, 1, 1]:
+                unsuited[product] = _strength(Category.ONE_PAIR, ranks)
+            case _:
+                # Five distinct ranks: straight and/or flush, depending on suits
+                mask = 0
+                for rank_idx in combo:
+                    mask |= 1 << rank_idx
+
+                if ranks == WHEEL_STRAIGHT:
+                    # Ace plays low, so the five is the top card
+                    straight_ranks = [5]
+                elif ranks[0] - ranks[4] == 4:
+                    straight_ranks = [ranks[0]]
+                else:
+                    flushes[mask] = _strength(Category.FLUSH, ranks)
+                    unsuited[product] = _strength(Category.HIGH_CARD, ranks)
+                    continue
+
+                flushes[mask] = _strength(Category.STRAIGHT_FLUSH, straight_ranks)
+                unsuited[product] = _strength(Category.STRAIGHT, straight_ranks)
+
+    return flushes, unsuited
+
+
+_FLUSH_STRENGTHS, _UNSUITED_STRENGTHS = _build_tables()
+
+
+def _evaluate(a: int, b: int, c: int, d: int, e: int) -> int:
+    """Return the integer strength of five card codes (higher is better)."""
+    if (a & 3) == (b & 3) == (c & 3) == (d & 3) == (e & 3):
+        return _FLUSH_STRENGTHS[
+            1 << (a >> 2) | 1 << (b >> 2) | 1 << (c >> 2) | 1 << (d >> 2) | 1 << (e >> 2)
+        ]
+    return _UNSUITED_STRENGTHS[
+        _RANK_PRIMES[a >> 2]
+        * _RANK_PRIMES[b >> 2]
+        * _RANK_PRIMES[c >> 2]
+        * _RANK_PRIMES[d >> 2]
+        * _RANK_PRIMES[e >> 2]
+    ]
+
+
+# --- Texas Hold'em ---------------------------------------------------------
+
+_BOARD_CARDS = 5
+
+# Boards per equity task; fixed so that sampling is reproducible for any
+# number of workers
+_EQUITY_CHUNK = 20_000
+
+
+def _evaluate_best(codes: list[int]) -> int:
+    """Return the strength of the best 5-card hand among the given card codes."""
+    return max(_evaluate(*hand) for hand in combinations(codes, Hand._NUM_CARDS))
+
+
+def _equity_chunk(
+    holes: list[list[int]],
+    board: list[int],
+    deck: list[int],
+    missing: int,
+    sample: bool,
+    seed: int,
+    start: int,
+    count: int,
+) -> tuple[list[int], list[int]]:
+    """Evaluate one chunk of boards for `equity`.
+
+    Returns:
+        Tuple of (outright wins, ties) per player within this chunk.
+    """
+    if sample:
+        rng = random.Random(f"{seed}:{start}")
+        boards = (board + rng.sample(deck, missing) for _ in range(count))
+    else:
+        boards = (
+            board + list(rest)
+            for rest in islice(combinations(deck, missing), start, start + count)
+        )
+
+    wins = [0] * len(holes)
+    ties = [0] * len(holes)
+    for full_board in boards:
+        strengths = [_evaluate_best(hole + full_board) for hole in holes]
+        best = max(strengths)
+        winners = [i for i, strength in enumerate(strengths) if strength == best]
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+        else:
+            for i in winners:
+                ties[i] += 1
+
+    return wins, ties
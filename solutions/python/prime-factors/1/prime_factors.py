@@ -1,3 +1,21 @@
+import random
+from array import array
+from collections.abc import Iterator
+from itertools import compress
+from math import gcd, isqrt
+
+# Primes used for trial division before switching to Pollard's rho
+SMALL_PRIME_LIMIT = 1000
+_SMALL_PRIMES = [
+    p for p in range(2, SMALL_PRIME_LIMIT) if all(p % d for d in range(2, isqrt(p) + 1))
+]
+
+# Miller-Rabin with these bases is deterministic for all n < _MILLER_RABIN_LIMIT
+# (the limit itself is a composite that passes all of them)
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MILLER_RABIN_LIMIT = 3317044064679887385961981
+
+
 def factors(value: int) -> list[int]:
     """
     Compute the prime factors of a given natural number.
@@ -5,6 +23,9 @@ def factors(value: int) -> list[int]:
     A prime factor is a prime number that divides the given number exactly, without leaving a remainder.
     This function returns a list of prime factors in ascending order, including repeated factors for their multiplicity.
 
+    Small factors are found by trial division; the remaining cofactor is split with
+    Pollard's rho (Brent's variant) until every part passes a Miller-Rabin primality test.
+
     Parameters:
         value (int): The natural number to factorize (must be greater than 1).
 
@@ -17,16 +38,212 @@ def factors(value: int) -> list[int]:
     """
     factors: list[int] = []  # List to store the prime factors
 
-    n = 2  # Start checking for factors from the smallest prime number
-    while n * n <= value:
-        # While n divides value evenly, it's a prime factor
-        while value % n == 0:
-            factors.append(n)  # Add n to the list of factors
-            value //= n  # Divide value by n and continue
-        n += 1  # Move to the next possible factor
+    # Divide out all small prime factors first
+    for p in _SMALL_PRIMES:
+        if p * p > value:
+            break
+        while value % p == 0:
+            factors.append(p)
+            value //= p
 
+    # Split whatever is left into primes
     if value > 1:
-        # If value is greater than 1, it is a prime factor itself
-        factors.append(value)
+        factors.extend(sorted(_split(value)))
 
     return factors
+
+
+def factor_range(n: int) -> Iterator[list[int]]:
+    """
+    Lazily compute the prime factors of every integer from 1 to n.
+
+    A table of smallest prime factors is built once (4 bytes per number); each
+    factorisation is then read off the table in O(number of factors).
+
+    Parameters:
+        n (int): The largest number to factorize (must fit in 32 bits).
+
+    Yields:
+        list[int]: The prime factors of 1, 2, ..., n, each in ascending order.
+
+    Example:
+        >>> list(factor_range(6))
+        [[], [2], [3], [2, 2], [5], [2, 3]]
+    """
+    spf = _smallest_prime_factors(n)
+    for value in range(1, n + 1):
+        factors: list[int] = []
+        while value > 1:
+            p = spf[value]
+            factors.append(p)
+            value //= p
+        yield factors
+
+
+def _smallest_prime_factors(n: int) -> array:
+    """
+    Return an array whose entry i is the smallest prime factor of i (for 2 <= i <= n).
+
+    The multiples of each prime p <= sqrt(n) are overwritten with p by slice assignment,
+    going from the largest prime down, so the smallest prime factor is written last.
+    Numbers that are never overwritten are prime and keep their own value.
+    """
+    spf = array("I", range(n + 1))
+
+    # The primes up to sqrt(n), using an odd-only sieve where index i stands for 2i + 1
+    root = isqrt(n)
+    is_prime = bytearray([1]) * (root // 2 + 1)
+    is_prime[0] = 0  # 1 is not a prime
+    for i in range(1, (isqrt(root) - 1) // 2 + 1):
+        if is_prime[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            is_prime[start::p] = bytes(len(range(start, len(is_prime), p)))
+    primes = list(compress(range(1, root + 1, 2), is_prime))
+    if root >= 2:
+        primes.insert(0, 2)
+
+    for p in reversed(primes):
+        # Multiples below p^2 have a smaller prime factor
+        count = len(range(p * p, n + 1, p))
+        spf[p * p :: p] = array("I", [p]) * count
+
+    return spf
+
+
+def _split(n: int) -> list[int]:
+    """Return the prime factors of n > 1, which has no factors below SMALL_PRIME_LIMIT."""
+    # No small factors, so anything below the square of the limit is prime
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT or _is_prime(n):
+        return [n]
+
+    d = _pollard_brent(n)
+    return _split(d) + _split(n // d)
+
+
+def _is_prime(n: int) -> bool:
+    """
+    Primality test for an odd n with no small factors.
+
+    Below _MILLER_RABIN_LIMIT, Miller-Rabin with fixed bases is exact. Above it,
+    use the Baillie-PSW test (Miller-Rabin to base 2 plus a strong Lucas test),
+    which has no known counterexample.
+    """
+    if n < _MILLER_RABIN_LIMIT:
+        return all(_is_strong_probable_prime(n, a) for a in _MILLER_RABIN_BASES)
+    return _is_strong_probable_prime(n, 2) and _is_strong_lucas_probable_prime(n)
+
+
+def _is_strong_probable_prime(n: int, a: int) -> bool:
+    """Miller-Rabin test of the odd n > a to base a."""
+    # Write n - 1 as d * 2^s with d odd
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+
+    return False  # a is a witness that n is composite
+
+
+def _is_strong_lucas_probable_prime(n: int) -> bool:
+    """
+    Strong Lucas test of the odd n > 1 with no small factors, using Selfridge's
+    parameters: the first D in 5, -7, 9, -11, ... with Jacobi symbol (D/n) = -1,
+    P = 1 and Q = (1 - D) / 4.
+    """
+    # A square n has no such D; the search below would never end
+    if isqrt(n) ** 2 == n:
+        return False
+
+    D = 5
+    while (j := _jacobi(D, n)) != -1:
+        if j == 0 and abs(D) != n:
+            return False  # D shares a factor with n
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    # Write n + 1 as d * 2^s with d odd
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def half(x: int) -> int:
+        # x / 2 modulo the odd n
+        x %= n
+        return (x + n if x % 2 else x) // 2
+
+    # Compute U_d, V_d and Q^d modulo n, going through the bits of d from the top
+    U, V, Qk = 1, P, Q
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V, Qk = half(P * U + V), half(D * U + P * V), Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        # V_2k = V_k^2 - 2 Q^k
+        V, Qk = (V * V - 2 * Qk) % n, Qk * Qk % n
+        if V == 0:
+            return True
+
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    """The Jacobi symbol (a/n) for an odd n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _pollard_brent(n: int) -> int:
+    """Find a non-trivial factor of the composite n with Pollard's rho (Brent's cycle detection)."""
+    # Seeded so that the factorisation takes the same path every time
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # Batch the gcd computations by multiplying the differences
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+
+        if g == n:
+            # The batch overshot: redo it one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+
+        if g != n:
+            return g
+        # Unlucky choice of parameters, try again
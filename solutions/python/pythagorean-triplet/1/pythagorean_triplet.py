@@ -1,3 +1,8 @@
+from array import array
+from collections.abc import Generator
+from math import gcd
+
+
 def triplets_with_sum(n: int) -> list[list[int]]:
     """
     Find all Pythagorean triplets [a, b, c] such that:
@@ -39,3 +44,129 @@ def triplets_with_sum(n: int) -> list[list[int]]:
         res.append([a, b, c])
 
     return res
+
+
+def iter_triplets(limit: int) -> Generator[list[int], None, None]:
+    """
+    Stream all Pythagorean triplets [a, b, c] with a < b < c and a + b + c <= limit.
+
+    Primitive triplets are generated with Euclid's formula and then scaled, so only
+    one triplet is held in memory at a time. The triplets are not ordered by sum.
+
+    Args:
+        limit (int): The largest sum (a + b + c) to include.
+
+    Yields:
+        list[int]: The triplets [a, b, c].
+    """
+    for a, b, c in _primitive_triplets(limit):
+        perimeter = a + b + c
+        for k in range(1, limit // perimeter + 1):
+            yield [k * a, k * b, k * c]
+
+
+def triplets_up_to(limit: int) -> "TripletTable":
+    """
+    Compute all Pythagorean triplets with a sum up to limit, grouped by their sum.
+
+    Args:
+        limit (int): The largest sum (a + b + c) to include.
+
+    Returns:
+        TripletTable: The triplets, queryable by sum in O(size of the result).
+    """
+    return TripletTable(limit)
+
+
+class TripletTable:
+    """
+    All Pythagorean triplets with a sum up to a limit, bucketed by their sum.
+
+    The triplets are stored in compressed sparse row form: the values array holds
+    a, b, c of every triplet back to back, ordered by sum and then by a, and
+    offsets[n] is the index of the first triplet with sum n (so the triplets with
+    sum n are those from offsets[n] to offsets[n + 1]).
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize a new TripletTable.
+
+        Args:
+            limit (int): The largest sum (a + b + c) to include.
+        """
+        self.limit = limit
+        primitives = list(_primitive_triplets(limit))
+
+        # Count the triplets per sum, then turn the counts into start offsets
+        counts = array("I", [0]) * (limit + 2)
+        for a, b, c in primitives:
+            perimeter = a + b + c
+            for multiple in range(perimeter, limit + 1, perimeter):
+                counts[multiple + 1] += 1
+        for n in range(1, limit + 2):
+            counts[n] += counts[n - 1]
+        self.offsets = counts
+
+        # Fill in the triplets, using a moving insert position per sum
+        self.values = array("I", [0]) * (3 * counts[limit + 1])
+        position = array("I", counts)
+        for a, b, c in primitives:
+            perimeter = a + b + c
+            for k, multiple in enumerate(range(perimeter, limit + 1, perimeter), 1):
+                i = 3 * position[multiple]
+                self.values[i : i + 3] = array("I", (k * a, k * b, k * c))
+                position[multiple] += 1
+
+        # Order the triplets of each sum by a, like triplets_with_sum
+        for n in range(limit + 1):
+            start, stop = counts[n], counts[n + 1]
+            if stop - start > 1:
+                triplets = sorted(
+                    self.values[3 * i : 3 * i + 3] for i in range(start, stop)
+                )
+                self.values[3 * start : 3 * stop] = array(
+                    "I", (x for triplet in triplets for x in triplet)
+                )
+
+    def __len__(self) -> int:
+        return len(self.values) // 3
+
+    def with_sum(self, n: int) -> list[list[int]]:
+        """
+        Return all triplets [a, b, c] with a + b + c = n, ordered by a.
+
+        Raises:
+            ValueError: If n is larger than the limit of this table.
+        """
+        if n > self.limit:
+            raise ValueError(f"sum must be <= {self.limit}")
+        if n < 0:
+            return []
+
+        values = self.values
+        return [
+            [values[i], values[i + 1], values[i + 2]]
+            for i in range(3 * self.offsets[n], 3 * self.offsets[n + 1], 3)
+        ]
+
+
+def _primitive_triplets(limit: int) -> Generator[tuple[int, int, int], None, None]:
+    """
+    Generate all primitive Pythagorean triplets (a, b, c) with a < b and a + b + c <= limit.
+
+    Euclid's formula: for coprime m > n > 0 of opposite parity,
+    (m^2 - n^2, 2mn, m^2 + n^2) is a primitive triplet with sum 2m(m + n),
+    and every primitive triplet arises exactly once this way.
+    """
+    m = 2
+    while 2 * m * (m + 1) <= limit:
+        # n must have the opposite parity of m
+        for n in range(1 if m % 2 == 0 else 2, m, 2):
+            if 2 * m * (m + n) > limit:
+                break
+            if gcd(m, n) != 1:
+                continue
+            a, b = m * m - n * n, 2 * m * n
+            yield (a, b, m * m + n * n) if a < b else (b, a, m * m + n * n)
+        m += 1
@@ -1,3 +1,31 @@
+import os
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import compress
+from math import isqrt, prod
+from multiprocessing.shared_memory import SharedMemory
+from typing import Generator
+
+# Number of odd numbers sieved at once. One byte per odd number, so each
+# segment is 256 KiB and stays in the L2 cache.
+SEGMENT_SIZE = 1 << 18
+
+# Small primes whose multiples are removed by copying a precomputed pattern
+# instead of being crossed off one by one (wheel factorisation on top of
+# skipping even numbers).
+WHEEL_PRIMES = (3, 5, 7, 11, 13)
+_WHEEL_PERIOD = prod(WHEEL_PRIMES)
+
+# Entry k of the pattern describes the odd number 2k + 1, which is divisible
+# by a wheel prime p exactly when k % p == p // 2, so the pattern repeats
+# every _WHEEL_PERIOD entries.
+_WHEEL_PATTERN = bytes(
+    all((2 * k + 1) % p for p in WHEEL_PRIMES) for k in range(_WHEEL_PERIOD)
+)
+
+
 def primes(limit: int) -> list[int]:
     """
     Generate all prime numbers less than or equal to a given limit using the Sieve of Eratosthenes algorithm.
@@ -12,20 +40,213 @@ def primes(limit: int) -> list[int]:
         >>> primes(10)
         [2, 3, 5, 7]
     """
+    return list(iter_primes(limit))
+
+
+def iter_primes(limit: int) -> Generator[int, None, None]:
+    """
+    Lazily generate all prime numbers less than or equal to a given limit.
+
+    Uses a segmented, odd-only Sieve of Eratosthenes, so memory use is O(sqrt(limit))
+    no matter how large the limit is. Primes are yielded one segment at a time.
+
+    Args:
+        limit (int): The upper bound (inclusive) for generating prime numbers.
+
+    Yields:
+        int: The prime numbers up to the limit, in increasing order.
+
+    Example:
+        >>> list(iter_primes(10))
+        [2, 3, 5, 7]
+    """
     if limit < 2:
+        return
+
+    yield 2
+    for lo, segment in _segments(limit):
+        yield from compress(range(lo, lo + 2 * len(segment), 2), segment)
+
+
+def count_primes(limit: int) -> int:
+    """
+    Count the prime numbers less than or equal to a given limit without materialising them.
+
+    Args:
+        limit (int): The upper bound (inclusive).
+
+    Returns:
+        int: The number of primes up to the limit.
+
+    Example:
+        >>> count_primes(100)
+        25
+    """
+    if limit < 2:
+        return 0
+
+    # 2 is the only even prime, the segments only cover odd numbers
+    return 1 + sum(segment.count(1) for _, segment in _segments(limit))
+
+
+def primes_range(
+    lo: int, hi: int, workers: int | None = None
+) -> Generator[int, None, None]:
+    """
+    Lazily generate all primes p with lo <= p < hi, sieving segments in parallel.
+
+    The base primes up to sqrt(hi) are computed once and shared with the worker
+    processes through shared memory. Each worker sieves whole segments, and the
+    primes are yielded in increasing order as the segments complete.
+
+    Args:
+        lo (int): The lower bound (inclusive).
+        hi (int): The upper bound (exclusive).
+        workers (int | None): Number of worker processes (None for one per CPU,
+            1 to sieve in the calling process).
+
+    Yields:
+        int: The prime numbers in [lo, hi), in increasing order.
+
+    Example:
+        >>> list(primes_range(10, 30, workers=2))
+        [11, 13, 17, 19, 23, 29]
+    """
+    if hi <= 2 or lo >= hi:
+        return
+
+    if lo <= 2:
+        yield 2
+    start = max(lo, 3) | 1  # segments start at odd numbers
+    bounds = (
+        (seg_lo, min(seg_lo + 2 * SEGMENT_SIZE, hi))
+        for seg_lo in range(start, hi, 2 * SEGMENT_SIZE)
+    )
+    base_primes = _base_primes(isqrt(hi - 1))
+
+    if workers == 1:
+        for seg_lo, seg_hi in bounds:
+            segment = _sieve_segment(seg_lo, seg_hi, base_primes)
+            yield from compress(range(seg_lo, seg_hi, 2), segment)
+        return
+
+    shm = SharedMemory(create=True, size=max(1, len(base_primes)) * 8)
+    try:
+        shm.buf[: len(base_primes) * 8] = array("Q", base_primes).tobytes()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_base_primes,
+            initargs=(shm.name, len(base_primes)),
+        ) as executor:
+            # Keep a bounded window of segments in flight, so results stream
+            # back in order without queueing the whole range
+            window = 2 * (workers or os.cpu_count() or 1)
+            pending: deque[tuple[int, int, Future[bytearray]]] = deque()
+            for seg_lo, seg_hi in bounds:
+                pending.append(
+                    (seg_lo, seg_hi, executor.submit(_sieve_shared, seg_lo, seg_hi))
+                )
+                if len(pending) >= window:
+                    seg_lo, seg_hi, future = pending.popleft()
+                    yield from compress(range(seg_lo, seg_hi, 2), future.result())
+            while pending:
+                seg_lo, seg_hi, future = pending.popleft()
+                yield from compress(range(seg_lo, seg_hi, 2), future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Base primes shared with a worker process, set up by _attach_base_primes
+_shared_memory: SharedMemory | None = None
+_shared_base_primes: Sequence[int] = ()
+
+
+def _attach_base_primes(name: str, count: int) -> None:
+    """Worker initializer: attach to the shared base primes."""
+    global _shared_memory, _shared_base_primes
+    _shared_memory = SharedMemory(name=name)
+    _shared_base_primes = _shared_memory.buf[: count * 8].cast("Q")
+
+
+def _sieve_shared(lo: int, hi: int) -> bytearray:
+    """Worker task: sieve one segment using the shared base primes."""
+    return _sieve_segment(lo, hi, _shared_base_primes)
+
+
+def _segments(limit: int) -> Generator[tuple[int, bytearray], None, None]:
+    """
+    Sieve the odd numbers up to limit segment by segment.
+
+    Yields:
+        tuple[int, bytearray]: The first (odd) number of the segment and its flags,
+        where flag i tells whether lo + 2 * i is prime.
+    """
+    base_primes = _base_primes(isqrt(limit))
+    for lo in range(1, limit + 1, 2 * SEGMENT_SIZE):
+        hi = min(lo + 2 * SEGMENT_SIZE, limit + 1)
+        yield lo, _sieve_segment(lo, hi, base_primes)
+
+
+def _base_primes(limit: int) -> list[int]:
+    """
+    Return the odd primes up to limit (used to sieve the segments).
+
+    Plain odd-only sieve, index i of the flags stands for 2i + 1.
+    """
+    if limit < 3:
         return []
 
-    # Initialize a boolean list to track numbers up to the limit
-    is_prime = [True] * (limit + 1)
-    # 0 and 1 are not primes
-    is_prime[0:2] = [False, False]
+    is_prime = bytearray([1]) * (limit // 2 + 1)
+    is_prime[0] = 0  # 1 is not a prime
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if is_prime[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            is_prime[start::p] = bytes(len(range(start, len(is_prime), p)))
+
+    return [2 * i + 1 for i in compress(range(len(is_prime)), is_prime)]
+
+
+def _sieve_segment(lo: int, hi: int, base_primes: Sequence[int]) -> bytearray:
+    """
+    Sieve the odd numbers in [lo, hi), where lo is odd.
+
+    Args:
+        lo (int): The first number of the segment; must be odd.
+        hi (int): The (exclusive) end of the segment.
+        base_primes (Sequence[int]): All odd primes up to at least sqrt(hi - 1).
+
+    Returns:
+        bytearray: Flag i is 1 if lo + 2 * i is prime, 0 otherwise.
+    """
+    size = (hi - lo + 1) // 2
+
+    # Start from the wheel pattern, aligned to the first number of the segment
+    offset = (lo // 2) % _WHEEL_PERIOD
+    repeats = (offset + size) // _WHEEL_PERIOD + 1
+    segment = bytearray((_WHEEL_PATTERN * repeats)[offset : offset + size])
+
+    if lo <= WHEEL_PRIMES[-1]:
+        # The pattern removed the wheel primes themselves and kept 1
+        for p in WHEEL_PRIMES:
+            if lo <= p < hi:
+                segment[(p - lo) // 2] = 1
+        if lo == 1:
+            segment[0] = 0
+
+    for p in base_primes:
+        if p * p >= hi:
+            break
+        if p <= WHEEL_PRIMES[-1]:
+            continue  # already removed by the wheel pattern
 
-    # Mark multiples of each prime as non-prime
-    for p in range(2, int(limit**0.5) + 1):
-        if is_prime[p]:
-            # Mark all multiples of p as non-prime
-            for multiple in range(p * p, limit + 1, p):
-                is_prime[multiple] = False
+        # First odd multiple of p that is >= lo, but not below p^2
+        # (smaller multiples have a smaller prime factor)
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        idx = (start - lo) // 2
+        segment[idx::p] = bytes(len(range(idx, size, p)))
 
-    # Collect all numbers marked as prime
-    return [i for i, prime in enumerate(is_prime) if prime]
+    return segment
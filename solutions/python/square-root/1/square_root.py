@@ -1,10 +1,14 @@
+import math
+from collections.abc import Iterable
+
+
 def square_root(number: int) -> int:
     """
-    Calculate the integer square root of a given positive whole number using Newton's method.
+    Calculate the integer square root of a given positive whole number.
 
     This function finds the square root of the input number, defined as the positive integer
-    that, when multiplied by itself, equals the input number. It does not use any built-in
-    math libraries or functions, and only handles cases where the result is a positive whole number.
+    that, when multiplied by itself, equals the input number. It only handles cases where the
+    result is a whole number.
 
     Parameters:
         number (int): A positive whole number whose square root is to be calculated.
@@ -16,8 +20,23 @@ def square_root(number: int) -> int:
         - The function assumes that the input number is a perfect square.
         - The implementation uses Newton's (Heron's) method for successive approximation.
     """
+    return _newton_isqrt(number)
+
+
+def _newton_isqrt(number: int) -> int:
+    """
+    Calculate the integer square root (the floor of the square root) with Newton's method.
+
+    The initial guess 2^ceil(bits / 2) is at least the square root, but at most twice
+    as large, so the iteration converges quadratically right from the start.
+    """
+    if number < 0:
+        raise ValueError("square root of a negative number")
+    if number == 0:
+        return 0
+
     # Start with an initial guess for the square root
-    guess = number
+    guess = 1 << ((number.bit_length() + 1) // 2)
     while True:
         # Compute a new approximation using Newton's method
         new_guess = (guess + number // guess) // 2
@@ -28,3 +47,18 @@ def square_root(number: int) -> int:
 
         # Update the guess for the next iteration
         guess = new_guess
+
+
+def square_roots(values: Iterable[int]) -> list[int]:
+    """
+    Calculate the integer square roots of many non-negative whole numbers.
+
+    Uses the built-in math.isqrt, which is exact for integers of any size.
+
+    Parameters:
+        values (Iterable[int]): Non-negative whole numbers.
+
+    Returns:
+        list[int]: The integer square root (floor) of each value.
+    """
+    return list(map(math.isqrt, values))
@@ -1,7 +1,6 @@
+from itertools import compress
 from math import lcm
 
-SIMPLE_SET_LIMIT_THRESHOLD = 2_000_000
-
 
 def sum_of_multiples(limit: int, multiples: list[int]) -> int:
     """Return the sum of all unique multiples of given base values less than a limit.
@@ -28,52 +27,72 @@ def sum_of_multiples(limit: int, multiples: list[int]) -> int:
     For `limit=20` and `multiples=[3, 5]` the function sums
     {3,5,6,9,10,12,15,18} -> 78.
     """
-    # Heuristic: if the level `limit` is small enough, use the
-    # straightforward set-based approach. This is a short, readable
-    # comprehension that works well when `limit` is modest.
-    # For large `limit` we fall back to inclusion-exclusion math to avoid
-    # enumerating many values.
-    if limit <= SIMPLE_SET_LIMIT_THRESHOLD:
-        # One-liner set comprehension: skip n==0 (falsy) and collect all
-        # multiples of n that are < limit; set removes duplicates.
-        return sum({i for n in multiples if n for i in range(n, limit, n)})
-
-    # Inclusion-exclusion path for large limits
-    total = 0
+    bases = _reduce_bases(limit, multiples)
+
+    # Inclusion-exclusion costs one step per subset of bases whose LCM is below
+    # `limit`, enumerating costs one step per multiple. Try inclusion-exclusion
+    # with a budget of as many steps as enumerating would take, and only fall back
+    # to enumerating if the budget runs out.
+    enumeration_cost = sum((limit - 1) // n for n in bases)
+    total = _inclusion_exclusion(limit, bases, enumeration_cost)
+    if total is not None:
+        return total
+
+    # Mark the multiples of every base value in a bytearray (one byte per number
+    # instead of a set of boxed ints); marking a number twice counts it once
+    is_multiple = bytearray(limit)
+    for n in bases:
+        is_multiple[n::n] = b"\x01" * len(range(n, limit, n))
+
+    # Sum the marked numbers without a Python-level loop
+    return sum(compress(range(limit), is_multiple))
+
+
+def _reduce_bases(limit: int, multiples: list[int]) -> list[int]:
+    """Drop base values that cannot add any multiples of their own.
+
+    Zero and values >= `limit` have no positive multiples below `limit`, and the
+    multiples of a value that is a multiple of another base value are already
+    counted for that base value.
 
-    # Number of available base factors. We will iterate over every non-empty
-    # subset of these factors using a bitmask. For num_factors factors there are
-    # (2**num_factors - 1) non-empty subsets.
-    num_factors = len(multiples)
-
-    # Inclusion-exclusion via bitmask iteration with descriptive names:
-    # - Each subset_mask (1 .. 2^num_factors - 1) represents a non-empty subset
-    #   of indices in `multiples`.
-    # - For each subset we compute:
-    #     * `subset_size`: number of selected factors
-    #     * `current_lcm`: least common multiple of selected factors
-    # - Add `_sum_multiples_of(current_lcm, limit)` when subset_size is odd,
-    #   subtract when even.
-    for subset_mask in range(1, 1 << num_factors):
-        # LCM identity: starting at 1 means the first selected factor becomes
-        # the running LCM directly (lcm(1, x) == x for positive x).
-        current_lcm = 1
-        subset_size = 0
-
-        # Build the LCM for the selected subset and count selected elements.
-        for index in range(num_factors):
-            if (subset_mask >> index) & 1:
-                subset_size += 1
-                # Use math.lcm for clarity and performance when available.
-                # math.lcm returns 0 if any argument is 0, which naturally
-                # yields zero contribution from such subsets.
-                current_lcm = lcm(current_lcm, multiples[index])
-
-        # Inclusion-exclusion: add for odd-sized subsets, subtract for even.
-        if subset_size % 2:
-            total += _sum_multiples_of(current_lcm, limit)
-        else:
-            total -= _sum_multiples_of(current_lcm, limit)
+    Returns the remaining base values in ascending order.
+    """
+    bases: list[int] = []
+    for n in sorted(set(multiples)):
+        if 0 < n < limit and all(n % b for b in bases):
+            bases.append(n)
+    return bases
+
+
+def _inclusion_exclusion(limit: int, bases: list[int], budget: int) -> int | None:
+    """Sum the unique multiples of `bases` below `limit` by inclusion-exclusion.
+
+    Subsets of `bases` are enumerated depth-first, in ascending order of their
+    elements. Each subset's LCM is computed once from its parent's, and a branch
+    is cut as soon as its LCM reaches `limit`: the subset and all its supersets
+    have no multiples below `limit`.
+
+    Returns None if more than `budget` subsets would have to be visited.
+    """
+    total = 0
+    visited = 0
+
+    # Stack of (index of the next base to add, LCM of the subset, sign of the
+    # next subset's term): add for odd-sized subsets, subtract for even-sized ones
+    stack = [(0, 1, 1)]
+    while stack:
+        start, subset_lcm, sign = stack.pop()
+        for index in range(start, len(bases)):
+            current_lcm = lcm(subset_lcm, bases[index])
+            if current_lcm >= limit:
+                continue  # no multiples below limit, neither for any superset
+
+            visited += 1
+            if visited > budget:
+                return None
+
+            total += sign * _sum_multiples_of(current_lcm, limit)
+            stack.append((index + 1, current_lcm, -sign))
 
     return total
 
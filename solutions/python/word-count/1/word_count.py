@@ -1,5 +1,13 @@
+import codecs
+import heapq
+import mmap
+import os
 import re
+from array import array
 from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
 
 # Regular expression to match words and numbers in a sentence.
 # - [a-z]+('[a-z]+)? matches words with optional contractions (e.g., "don't", "you're").
@@ -9,6 +17,24 @@ from collections import Counter
 # The pattern is case-insensitive due to re.IGNORECASE.
 WORD_PATTERN = re.compile(r"[a-z]+('[a-z]+)?|\d+", re.IGNORECASE)
 
+# Trailing characters that may belong to a word continued in the next chunk
+# (the same character classes as WORD_PATTERN, so \d also covers non-ASCII digits).
+# The lookbehind only lets the match start at the beginning of the run, so the
+# search takes linear time even for very long runs.
+_TOKEN_TAIL = re.compile(r"(?<![a-z\d'])[a-z\d']*\Z", re.IGNORECASE)
+
+# Bytes that may be part of a word in UTF-8 text: ASCII word characters and all
+# bytes of multi-byte characters. Files are only split at other (ASCII) bytes,
+# which never fall inside a character.
+_TOKEN_BYTES = re.compile(rb"[a-z\d'\x80-\xff]*", re.IGNORECASE)
+
+# Number of bytes of a file decoded and counted at once
+FILE_BLOCK_SIZE = 1 << 20
+
+# Default size of the count-min sketch used in top-K mode
+SKETCH_WIDTH = 1 << 20
+SKETCH_DEPTH = 4
+
 
 def count_words(sentence: str) -> dict[str, int]:
     """
@@ -25,3 +51,213 @@ def count_words(sentence: str) -> dict[str, int]:
         dict[str, int]: A dictionary mapping each word (in lowercase) to its count in the sentence.
     """
     return Counter((match.group().lower() for match in WORD_PATTERN.finditer(sentence)))
+
+
+def count_words_stream(
+    chunks: Iterable[str | bytes], top_k: int | None = None
+) -> dict[str, int]:
+    """
+    Count the occurrences of each word in a stream of text chunks.
+
+    Words may be split across chunk boundaries. Each chunk is cut after its last
+    character that cannot be part of a word, and the rest is carried over to the
+    next chunk, so the counts are exactly those of count_words on the whole text.
+    Only the carried run of word characters is kept between chunks, so memory is
+    bounded by the chunk size plus the longest word.
+
+    Bytes chunks are decoded as UTF-8 with an incremental decoder, so characters
+    may also be split across chunk boundaries.
+
+    Args:
+        chunks (Iterable[str | bytes]): The text, in pieces.
+        top_k (int | None): If given, only the (approximately) most frequent `top_k`
+            words are tracked, using a count-min sketch and a heap, so memory does not
+            grow with the vocabulary. Must be at least 1.
+
+    Returns:
+        dict[str, int]: A dictionary mapping each word (in lowercase) to its count. In
+        top-K mode, the counts are count-min estimates (never too low).
+
+    Raises:
+        ValueError: If top_k is less than 1.
+    """
+    counter: Counter[str] | _TopK = Counter() if top_k is None else _TopK(top_k)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    # Pieces of the run of word characters at the end of the text so far; joined
+    # once the run ends, so a long run is never copied or scanned again
+    carry: list[str] = []
+    for chunk in chunks:
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        cut = _TOKEN_TAIL.search(text).start()
+        if cut == 0:
+            carry.append(text)
+            continue
+        head = "".join(carry) + text[:cut]
+        carry = [text[cut:]]
+        counter.update(match.group().lower() for match in WORD_PATTERN.finditer(head))
+    carry.append(decoder.decode(b"", final=True))
+    counter.update(
+        match.group().lower() for match in WORD_PATTERN.finditer("".join(carry))
+    )
+
+    return dict(counter) if top_k is None else counter.most_common()
+
+
+def count_words_file(
+    path: str | os.PathLike[str], top_k: int | None = None
+) -> dict[str, int]:
+    """
+    Count the occurrences of each word in a UTF-8 file, reading it through mmap.
+
+    The file is decoded and counted in blocks of FILE_BLOCK_SIZE bytes (see
+    count_words_stream), so it is never loaded into memory as a whole.
+
+    Args:
+        path (str | os.PathLike[str]): The file to analyze.
+        top_k (int | None): If given, only track the most frequent `top_k` words
+            (see count_words_stream).
+
+    Returns:
+        dict[str, int]: A dictionary mapping each word (in lowercase) to its count.
+
+    Raises:
+        ValueError: If top_k is less than 1.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return count_words_stream((), top_k)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            blocks = (
+                mapped[start : start + FILE_BLOCK_SIZE]
+                for start in range(0, len(mapped), FILE_BLOCK_SIZE)
+            )
+            return count_words_stream(blocks, top_k)
+
+
+def count_words_parallel(
+    path: str | os.PathLike[str], workers: int | None = None
+) -> dict[str, int]:
+    """
+    Count the occurrences of each word in a large UTF-8 file using a process pool.
+
+    The file is split into shards at ASCII bytes that cannot be part of a word (so
+    never inside a word or a character), each shard is decoded and counted with
+    count_words in a worker process, and the partial counts are merged pairwise in
+    a tree reduction.
+
+    Args:
+        path (str | os.PathLike[str]): The file to analyze.
+        workers (int | None): Number of worker processes (None for one per CPU).
+
+    Returns:
+        dict[str, int]: A dictionary mapping each word (in lowercase) to its count.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # A few shards per worker so that uneven shards still balance out
+            num_shards = 4 * (workers or os.cpu_count() or 1)
+            offsets = [0]
+            for i in range(1, num_shards):
+                # Move the cut forward to the end of any word it falls into
+                target = max(i * size // num_shards, offsets[-1])
+                cut = _TOKEN_BYTES.match(mapped, target).end()
+                if cut < size:
+                    offsets.append(cut)
+            offsets.append(size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = [
+            Counter(shard)
+            for shard in executor.map(
+                _count_file_shard, [path] * (len(offsets) - 1), offsets, offsets[1:]
+            )
+        ]
+
+    # Tree reduction: merge neighbouring partial counts until one is left
+    while len(counts) > 1:
+        merged = counts[::2]
+        for left, right in zip(merged, counts[1::2]):
+            left.update(right)
+        counts = merged
+
+    return dict(counts[0])
+
+
+def _count_file_shard(path: str, start: int, end: int) -> dict[str, int]:
+    """Worker task: count the words in the bytes [start, end) of a UTF-8 file."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return count_words(mapped[start:end].decode("utf-8"))
+
+
+class _TopK:
+    """
+    Approximate the most frequent words with a count-min sketch and a heap.
+
+    The sketch estimates the count of every word in fixed memory (estimates are
+    never too low). The `k` words with the highest estimates are kept in a min-heap,
+    with a dict of their current estimates; stale heap entries are skipped lazily.
+    """
+
+    def __init__(self, k: int, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH):
+        if k < 1:
+            raise ValueError("top_k must be at least 1")
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self._rows = [array("Q", [0]) * width for _ in range(depth)]
+        self._top: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+
+    def _add(self, word: str) -> int:
+        """Count one occurrence of word and return its new estimate."""
+        digest = blake2b(word.encode(), digest_size=4 * self.depth).digest()
+        estimate = None
+        for row, i in zip(self._rows, range(0, 4 * self.depth, 4)):
+            col = int.from_bytes(digest[i : i + 4], "little") % self.width
+            row[col] += 1
+            if estimate is None or row[col] < estimate:
+                estimate = row[col]
+        return estimate
+
+    def update(self, words: Iterable[str]) -> None:
+        """Count the given words."""
+        for word in words:
+            estimate = self._add(word)
+            if word in self._top:
+                self._top[word] = estimate
+                heapq.heappush(self._heap, (estimate, word))
+            elif len(self._top) < self.k:
+                self._top[word] = estimate
+                heapq.heappush(self._heap, (estimate, word))
+            else:
+                # Replace the least frequent tracked word if this one is more frequent
+                smallest = self._pop_smallest()
+                if estimate > smallest[0]:
+                    del self._top[smallest[1]]
+                    self._top[word] = estimate
+                    heapq.heappush(self._heap, (estimate, word))
+                else:
+                    heapq.heappush(self._heap, smallest)
+
+            # Drop stale entries once the heap has grown well beyond k
+            if len(self._heap) > 4 * self.k + 64:
+                self._heap = [(count, w) for w, count in self._top.items()]
+                heapq.heapify(self._heap)
+
+    def _pop_smallest(self) -> tuple[int, str]:
+        """Pop the tracked word with the lowest current estimate."""
+        while True:
+            count, word = heapq.heappop(self._heap)
+            if self._top.get(word) == count:
+                return count, word
+
+    def most_common(self) -> dict[str, int]:
+        """Return the tracked words and their estimates, most frequent first."""
+        return dict(sorted(self._top.items(), key=lambda item: item[1], reverse=True))